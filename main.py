@@ -1,18 +1,23 @@
-from fastapi import FastAPI, BackgroundTasks, HTTPException, Depends, Query, Path, status
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Depends, Query, Path, Request, status, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, ORJSONResponse, Response
+import msgspec
+import orjson
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional, List, Dict, Any, Union
 import os
-import uuid
+import secrets
+import time
 import logging
 from datetime import datetime
 import asyncio
 from enum import Enum
+import concurrent.futures
 import uvicorn
 
-# Import the existing Reddit scraper
-from scraper import EnhancedRedditScraper
+# Task storage backend (Redis when REDIS_URL is set, SQLite otherwise)
+import task_store as task_store_module
+from task_store import get_task_store
 
 # Set up logging
 logging.basicConfig(
@@ -29,7 +34,8 @@ logger = logging.getLogger("reddit_api")
 app = FastAPI(
     title="Reddit Scraper API",
     description="API for scraping Reddit subreddits and posts",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -59,6 +65,7 @@ class TimeFilter(str, Enum):
 class OutputFormat(str, Enum):
     csv = "csv"
     json = "json"
+    jsonl = "jsonl"
     txt = "txt"
 
 # Pydantic models for request validation
@@ -73,11 +80,13 @@ class ScrapeRequest(BaseModel):
     delay_min: float = Field(1.0, ge=0.5, description="Minimum delay between requests")
     delay_max: float = Field(3.0, ge=1.0, description="Maximum delay between requests")
 
-    @validator('delay_max')
-    def check_delay_range(cls, v, values):
-        if 'delay_min' in values and v < values['delay_min']:
+    # mode='after' runs inside the schema compiled once by pydantic-core,
+    # instead of resolving a v1-style validator descriptor per request
+    @model_validator(mode='after')
+    def check_delay_range(self):
+        if self.delay_max < self.delay_min:
             raise ValueError('maximum delay must be greater than minimum delay')
-        return v
+        return self
 
 class ScrapeResponse(BaseModel):
     task_id: str
@@ -95,8 +104,237 @@ class TaskStatus(BaseModel):
     output_file: Optional[str] = None
     error: Optional[str] = None
 
+# msgspec mirror of TaskStatus used on the read paths - encoding a Struct
+# is much cheaper than building a Pydantic model per task per request
+class TaskStatusStruct(msgspec.Struct):
+    task_id: str
+    status: str
+    subreddit: str
+    start_time: str
+    completion_time: Optional[str] = None
+    post_count: Optional[int] = None
+    output_file: Optional[str] = None
+    error: Optional[str] = None
+
+# Frozenset so projection uses C-level set/dict-keys intersection
+_TASK_STATUS_FIELDS = frozenset(TaskStatusStruct.__struct_fields__)
+
+def _format_task_times(task: dict) -> dict:
+    """Render internally-stored epoch timestamps as ISO strings for responses."""
+    for key in ("start_time", "completion_time"):
+        value = task.get(key)
+        if isinstance(value, (int, float)):
+            task[key] = datetime.fromtimestamp(value).isoformat()
+    return task
+
+def _task_to_struct(task: dict) -> TaskStatusStruct:
+    task = _format_task_times(task)
+    return TaskStatusStruct(**{k: task[k] for k in _TASK_STATUS_FIELDS & task.keys()})
+
+# Straight-line validator for the fixed /scrape body shape, built once at
+# import time. Nine known fields don't need a schema-tree walk per request;
+# enum membership is checked against prebuilt frozensets. ScrapeRequest
+# stays as the documented schema in OpenAPI.
+_SORT_VALUES = frozenset(member.value for member in SortType)
+_TIME_VALUES = frozenset(member.value for member in TimeFilter)
+_FORMAT_VALUES = frozenset(member.value for member in OutputFormat)
+
+def _validate_scrape_payload(data: dict) -> dict:
+    """Validate a /scrape body dict; raises ValueError with a reason."""
+    if not isinstance(data, dict):
+        raise ValueError("request body must be a JSON object")
+
+    subreddit = data.get("subreddit")
+    if not isinstance(subreddit, str) or len(subreddit) < 1:
+        raise ValueError("subreddit must be a non-empty string")
+
+    post_limit = data.get("post_limit", 25)
+    if not isinstance(post_limit, int) or isinstance(post_limit, bool) or not 1 <= post_limit <= 100:
+        raise ValueError("post_limit must be an integer between 1 and 100")
+
+    output_format = data.get("output_format", "json")
+    if output_format not in _FORMAT_VALUES:
+        raise ValueError(f"output_format must be one of {sorted(_FORMAT_VALUES)}")
+
+    include_comments = data.get("include_comments", False)
+    if not isinstance(include_comments, bool):
+        raise ValueError("include_comments must be a boolean")
+
+    pages = data.get("pages", 1)
+    if not isinstance(pages, int) or isinstance(pages, bool) or not 1 <= pages <= 10:
+        raise ValueError("pages must be an integer between 1 and 10")
+
+    sort_by = data.get("sort_by", "hot")
+    if sort_by not in _SORT_VALUES:
+        raise ValueError(f"sort_by must be one of {sorted(_SORT_VALUES)}")
+
+    time_filter = data.get("time_filter", "all")
+    if time_filter not in _TIME_VALUES:
+        raise ValueError(f"time_filter must be one of {sorted(_TIME_VALUES)}")
+
+    delay_min = data.get("delay_min", 1.0)
+    if not isinstance(delay_min, (int, float)) or isinstance(delay_min, bool) or delay_min < 0.5:
+        raise ValueError("delay_min must be a number >= 0.5")
+
+    delay_max = data.get("delay_max", 3.0)
+    if not isinstance(delay_max, (int, float)) or isinstance(delay_max, bool) or delay_max < 1.0:
+        raise ValueError("delay_max must be a number >= 1.0")
+    if delay_max < delay_min:
+        raise ValueError("maximum delay must be greater than minimum delay")
+
+    return {
+        "subreddit": subreddit,
+        "post_limit": post_limit,
+        "output_format": output_format,
+        "include_comments": include_comments,
+        "pages": pages,
+        "sort_by": sort_by,
+        "time_filter": time_filter,
+        "delay_min": float(delay_min),
+        "delay_max": float(delay_max)
+    }
+
 # Store for background tasks
-task_store = {}
+task_store = get_task_store()
+
+# How often the expired-task sweeper runs (seconds)
+SWEEP_INTERVAL = int(os.getenv("TASK_SWEEP_INTERVAL", "300"))
+
+async def sweep_expired_tasks():
+    """Periodically remove expired tasks and their orphaned output files."""
+    while True:
+        await asyncio.sleep(SWEEP_INTERVAL)
+        try:
+            await task_store.sweep()
+            await evict_orphan_files()
+        except Exception as e:
+            logger.error(f"Error sweeping expired tasks: {str(e)}")
+
+async def evict_orphan_files():
+    """Delete output files whose task has already been evicted from the store."""
+    if not os.path.isdir("output"):
+        return
+    referenced = {task.get("output_file") for task in await task_store.list()}
+    cutoff = time.time() - task_store_module.TASK_TTL_SECONDS
+    for name in os.listdir("output"):
+        path = os.path.join("output", name)
+        try:
+            # Only remove files old enough that no live task can still own them
+            if name not in referenced and os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                logger.info(f"Removed orphaned output file {name}")
+        except OSError as e:
+            logger.error(f"Error removing orphaned file {path}: {str(e)}")
+
+# Long-poll support: waiters on GET /tasks/{id}?wait= block on a per-task
+# event that the update writer sets when the task reaches a terminal state
+_task_done_events: dict = {}
+
+def _task_done_event(task_id: str) -> asyncio.Event:
+    event = _task_done_events.get(task_id)
+    if event is None:
+        event = _task_done_events[task_id] = asyncio.Event()
+    return event
+
+async def queue_task_update(task_id: str, patch: dict):
+    """Queue a status patch for the single writer coroutine to apply."""
+    await app.state.update_q.put((task_id, patch))
+
+async def apply_task_updates():
+    """
+    Drain queued status patches in batches.
+
+    Funneling all updates through one writer coalesces bursts of
+    simultaneously-completing scrapes into fewer store round trips.
+    The batch cap adapts to queue depth: it grows under pressure and
+    shrinks back when the queue is mostly idle.
+    """
+    batch_cap = 16
+    while True:
+        batch = [await app.state.update_q.get()]
+        while not app.state.update_q.empty() and len(batch) < batch_cap:
+            batch.append(app.state.update_q.get_nowait())
+
+        depth = app.state.update_q.qsize()
+        if depth > 32:
+            batch_cap = min(batch_cap * 2, 256)
+        elif depth < 4:
+            batch_cap = max(16, batch_cap // 2)
+
+        for task_id, patch in batch:
+            try:
+                await task_store.update(task_id, patch)
+                if patch.get("status") in task_store_module.TERMINAL_STATES:
+                    event = _task_done_events.pop(task_id, None)
+                    if event is not None:
+                        event.set()
+            except Exception as e:
+                logger.error(f"Error applying update for task {task_id}: {str(e)}")
+            finally:
+                app.state.update_q.task_done()
+
+@app.on_event("startup")
+async def startup_store():
+    await task_store.setup()
+    app.state.sweeper = asyncio.create_task(sweep_expired_tasks())
+    app.state.update_q = asyncio.Queue()
+    app.state.update_writer = asyncio.create_task(apply_task_updates())
+    # Scrapes are CPU-heavy (HTML parsing) and fully synchronous, so they
+    # run in worker processes instead of blocking the event loop
+    app.state.pool = concurrent.futures.ProcessPoolExecutor(
+        max_workers=int(os.getenv("SCRAPE_PROCESSES", os.cpu_count() or 1))
+    )
+    # Cap in-flight scrapes so a request flood queues instead of
+    # allocating scraper state for every connection at once
+    app.state.scrape_sem = asyncio.Semaphore(int(os.getenv("MAX_CONCURRENT_SCRAPES", "8")))
+    # Persistent workers consume queued scrape jobs; a fixed worker count
+    # replaces per-request BackgroundTasks machinery on the POST path
+    app.state.scrape_q = asyncio.Queue()
+    app.state.scrape_workers = [
+        asyncio.create_task(scrape_worker())
+        for _ in range(int(os.getenv("SCRAPE_WORKERS", "4")))
+    ]
+
+async def scrape_worker():
+    """Pull queued scrape jobs and run them, one at a time per worker."""
+    while True:
+        job = await app.state.scrape_q.get()
+        try:
+            await run_scraper_task(**job)
+        except Exception as e:
+            logger.error(f"Scrape worker error: {str(e)}")
+        finally:
+            app.state.scrape_q.task_done()
+
+@app.on_event("shutdown")
+async def shutdown_store():
+    # Give the writer a moment to drain any queued patches before stopping
+    try:
+        await asyncio.wait_for(app.state.update_q.join(), timeout=5)
+    except asyncio.TimeoutError:
+        logger.warning("Task update queue did not drain before shutdown")
+    for worker in app.state.scrape_workers:
+        worker.cancel()
+    app.state.update_writer.cancel()
+    app.state.sweeper.cancel()
+    app.state.pool.shutdown(wait=False, cancel_futures=True)
+    await task_store.close()
+
+def _run_scrape(params: dict):
+    """
+    Construct and run a scraper in a worker process.
+
+    Module-level so it can be pickled by ProcessPoolExecutor.
+    Returns (saved_path, analytics).
+    """
+    # Deferred so uvicorn workers that never handle a scrape don't pay the
+    # scraper's import chain (requests/bs4/pandas) in their baseline RSS;
+    # sys.modules caches it after the first job
+    from scraper import EnhancedRedditScraper
+
+    filename = params.pop("filename")
+    scraper = EnhancedRedditScraper(**params)
+    return scraper.run_full_scrape(filename)
 
 # Function to run the scraper in the background
 async def run_scraper_task(task_id: str, subreddit: str, post_limit: int, output_format: str,
@@ -104,175 +342,293 @@ async def run_scraper_task(task_id: str, subreddit: str, post_limit: int, output
                           delay_min: float, delay_max: float):
     """Run the scraper in the background and update the task status."""
     try:
-        task_store[task_id]["status"] = "running"
-        
-        # Create a unique filename for this task
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{subreddit}_{sort_by}_{task_id}_{timestamp}"
-        
-        # Run the scraper (this is synchronous but we're running it in a background task)
-        scraper = EnhancedRedditScraper(
-            subreddit=subreddit,
-            post_limit=post_limit,
-            output_format=output_format,
-            include_comments=include_comments,
-            pages=pages,
-            sort_by=sort_by,
-            time_filter=time_filter,
-            delay=(delay_min, delay_max)
-        )
-        
-        saved_path, analytics = scraper.run_full_scrape(filename)
-        
+        # Excess scrapes wait here in the queued state until a slot frees up
+        await queue_task_update(task_id, {"status": "queued"})
+        async with app.state.scrape_sem:
+            await queue_task_update(task_id, {"status": "running"})
+
+            # Create a unique filename for this task
+            timestamp = time.strftime('%Y%m%d_%H%M%S', time.gmtime())
+            filename = f"{subreddit}_{sort_by}_{task_id}_{timestamp}"
+
+            # Run the scraper in a worker process so the event loop stays free
+            # and concurrent scrapes spread across cores
+            params = {
+                "subreddit": subreddit,
+                "post_limit": post_limit,
+                "output_format": output_format,
+                "include_comments": include_comments,
+                "pages": pages,
+                "sort_by": sort_by,
+                "time_filter": time_filter,
+                "delay": (delay_min, delay_max),
+                "filename": filename
+            }
+            # Snapshot the parameters here rather than on the POST critical
+            # path; the 202 has long been sent by the time this runs
+            await task_store.set_parameters(
+                task_id, {k: v for k, v in params.items() if k != "filename"}
+            )
+
+            loop = asyncio.get_running_loop()
+            saved_path, analytics = await loop.run_in_executor(app.state.pool, _run_scrape, params)
+
         if saved_path:
-            task_store[task_id].update({
+            await task_store.set_analytics(task_id, analytics)
+            await queue_task_update(task_id, {
                 "status": "completed",
-                "completion_time": datetime.now().isoformat(),
+                "completion_time": int(time.time()),
                 "post_count": analytics.get('total_posts', 0),
                 "output_file": os.path.basename(saved_path),
-                "analytics": analytics
+                # Resolved once here so download/delete skip path building
+                "output_path": os.path.abspath(saved_path)
             })
         else:
-            task_store[task_id].update({
+            await queue_task_update(task_id, {
                 "status": "failed",
-                "completion_time": datetime.now().isoformat(),
+                "completion_time": int(time.time()),
                 "error": "Failed to save results"
             })
-            
+
     except Exception as e:
         logger.error(f"Error in task {task_id}: {str(e)}")
-        task_store[task_id].update({
+        await queue_task_update(task_id, {
             "status": "failed",
-            "completion_time": datetime.now().isoformat(),
+            "completion_time": int(time.time()),
             "error": str(e)
         })
 
 # API endpoints
-@app.post("/scrape", response_model=ScrapeResponse, status_code=status.HTTP_202_ACCEPTED)
-async def scrape_subreddit(
-    request: ScrapeRequest,
-    background_tasks: BackgroundTasks
-):
+# responses= keeps the ScrapeResponse schema in OpenAPI without FastAPI
+# re-validating the handler's return value on every request
+@app.post(
+    "/scrape",
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={202: {"model": ScrapeResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ScrapeRequest.model_json_schema()}}
+        }
+    }
+)
+async def scrape_subreddit(request: Request):
     """
     Start a new scraping task for a subreddit.
     
     This endpoint runs the scraper in the background and returns a task ID
     that can be used to check the status of the scraping task.
     """
-    task_id = str(uuid.uuid4())
+    # Parse with orjson and validate with the precompiled straight-line
+    # checker instead of going through Pydantic per request
+    try:
+        fields = _validate_scrape_payload(orjson.loads(await request.body()))
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=422, detail="request body is not valid JSON")
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    # One urandom read, no hyphenated-string formatting pass; the id is
+    # only a store key and URL path segment
+    task_id = secrets.token_urlsafe(12)
     
-    # Create a new task entry
-    task_store[task_id] = {
+    # Create a new task entry; the record holds only the slim status fields,
+    # request parameters go to side storage like analytics
+    await task_store.set(task_id, {
         "task_id": task_id,
         "status": "pending",
-        "subreddit": request.subreddit,
-        "start_time": datetime.now().isoformat(),
-        "parameters": request.dict()
-    }
+        "subreddit": fields["subreddit"],
+        # Stored as an epoch int; formatted to ISO only when responding
+        "start_time": int(time.time())
+    })
     
-    # Add the task to the background tasks
-    background_tasks.add_task(
-        run_scraper_task,
-        task_id,
-        request.subreddit,
-        request.post_limit,
-        request.output_format,
-        request.include_comments,
-        request.pages,
-        request.sort_by,
-        request.time_filter,
-        request.delay_min,
-        request.delay_max
-    )
+    # Hand the job to the worker pool; put_nowait never blocks the handler
+    app.state.scrape_q.put_nowait({
+        "task_id": task_id,
+        "subreddit": fields["subreddit"],
+        "post_limit": fields["post_limit"],
+        "output_format": fields["output_format"],
+        "include_comments": fields["include_comments"],
+        "pages": fields["pages"],
+        "sort_by": fields["sort_by"],
+        "time_filter": fields["time_filter"],
+        "delay_min": fields["delay_min"],
+        "delay_max": fields["delay_max"]
+    })
     
-    return ScrapeResponse(
-        task_id=task_id,
-        status="pending",
-        subreddit=request.subreddit,
-        message="Scraping task started"
-    )
+    return {
+        "task_id": task_id,
+        "status": "pending",
+        "subreddit": fields["subreddit"],
+        "message": "Scraping task started"
+    }
 
-@app.get("/tasks", response_model=List[TaskStatus])
-async def get_all_tasks():
+@app.get("/tasks", responses={200: {"model": List[TaskStatus]}})
+async def get_all_tasks(
+    ids: Optional[str] = Query(None, description="Comma-separated task IDs; returns just those records instead of the full list")
+):
     """
     Get a list of all tasks and their statuses.
+    
+    With ``ids`` set, only the named tasks are fetched - point lookups
+    instead of scanning and serializing the whole store.
     """
-    return [TaskStatus(**{k: v for k, v in task.items() if k != "parameters" and k != "analytics"}) 
-            for task in task_store.values()]
+    if ids:
+        wanted = [task_id for task_id in ids.split(",") if task_id]
+        found = await asyncio.gather(*(task_store.get(task_id) for task_id in wanted))
+        tasks = [task for task in found if task is not None]
+    else:
+        tasks = await task_store.list()
+    return Response(
+        content=msgspec.json.encode([_task_to_struct(task) for task in tasks]),
+        media_type="application/json"
+    )
+
+@app.websocket("/tasks/ws")
+async def stream_task_completions(websocket: WebSocket):
+    """
+    Push completion notifications for a batch of tasks.
+
+    The client sends ``{"ids": [...]}`` once; the server replies with one
+    ``{"task_id": ..., "status": ...}`` message per task as each reaches a
+    terminal state, then closes. Rides the same per-task events as the
+    long-poll path, so waiting N tasks costs no polling round trips.
+    """
+    await websocket.accept()
+    try:
+        message = await websocket.receive_json()
+    except WebSocketDisconnect:
+        return
+    task_ids = [t for t in (message.get("ids") or []) if isinstance(t, str)]
+    send_lock = asyncio.Lock()
+
+    async def notify(task_id: str):
+        task = await task_store.get(task_id)
+        while task is not None and task.get("status") not in task_store_module.TERMINAL_STATES:
+            event = _task_done_event(task_id)
+            # Re-read after registering so a completion between the first
+            # read and event creation is not missed
+            task = await task_store.get(task_id) or task
+            if task.get("status") in task_store_module.TERMINAL_STATES:
+                break
+            # Bounded wait like the long-poll path: completion events are
+            # per-process, so re-read the store periodically in case the
+            # task finished on another worker
+            try:
+                await asyncio.wait_for(event.wait(), timeout=30)
+            except asyncio.TimeoutError:
+                pass
+            # A vanished record means the task was deleted while waiting
+            task = await task_store.get(task_id)
+        task_status = task.get("status", "unknown") if task else "unknown"
+        async with send_lock:
+            await websocket.send_json({"task_id": task_id, "status": task_status})
+
+    try:
+        await asyncio.gather(*(notify(task_id) for task_id in task_ids))
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
 
 @app.get("/tasks/{task_id}")
 async def get_task_status(
     task_id: str = Path(..., description="The ID of the task to check"),
-    include_analytics: bool = Query(False, description="Include analytics in the response")
+    include_analytics: bool = Query(False, description="Include analytics in the response"),
+    wait: float = Query(0, ge=0, le=30, description="Long-poll: hold the request up to this many seconds until the task finishes")
 ):
     """
     Get the status of a specific task.
     
-    Optionally include analytics data if the task has completed.
+    Optionally include analytics data if the task has completed. With
+    ``wait`` set, the request blocks until the task reaches a terminal
+    state or the wait window elapses, so pollers see transitions
+    immediately instead of on their next interval.
     """
-    if task_id not in task_store:
+    task = await task_store.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    
-    # Get the full task data
-    task = task_store[task_id]
-    
+    if wait > 0 and task.get("status") not in task_store_module.TERMINAL_STATES:
+        event = _task_done_event(task_id)
+        # Re-read after registering so a completion between the first read
+        # and event creation is not missed
+        task = await task_store.get(task_id) or task
+        if task.get("status") not in task_store_module.TERMINAL_STATES:
+            try:
+                await asyncio.wait_for(event.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+            task = await task_store.get(task_id) or task
+    task = _format_task_times(task)
+
     # Log the task data to help with debugging
     logger.info(f"Task data for {task_id}: {task}")
-    
+
+    # Project through the public status fields; the stored record also
+    # carries server-side details like output_path that must not leak
+    payload = {k: task[k] for k in _TASK_STATUS_FIELDS & task.keys()}
+
     # Return the complete task data when analytics are requested
     if include_analytics:
-        # Force analytics to be included if not present
-        if "analytics" not in task and task.get("status") == "completed":
-            task["analytics"] = {
+        analytics = await task_store.get_analytics(task_id)
+        if analytics is None and task.get("status") == "completed":
+            # Force analytics to be included if not present
+            analytics = {
                 "execution_time": "N/A",
                 "posts_per_second": "N/A",
                 "total_posts": task.get("post_count", 0)
             }
-        return task
-    else:
-        # Filter out parameters and analytics for normal responses
-        return {k: v for k, v in task.items() if k != "parameters" and k != "analytics"}
+        if analytics is not None:
+            payload["analytics"] = analytics
+    return Response(content=msgspec.json.encode(payload), media_type="application/json")
 
-@app.get("/download/{task_id}")
+# HEAD lets clients check size/existence without transferring the file
+@app.api_route("/download/{task_id}", methods=["GET", "HEAD"])
 async def download_result(task_id: str = Path(..., description="The ID of the task to download")):
     """
     Download the result file for a completed task.
     """
-    if task_id not in task_store:
+    task = await task_store.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    
-    task = task_store[task_id]
-    
+
     if task.get("status") != "completed":
         raise HTTPException(status_code=400, detail="Task not completed")
     
     if "output_file" not in task:
         raise HTTPException(status_code=404, detail="Output file not found")
     
-    file_path = os.path.join("output", task["output_file"])
-    
-    if not os.path.exists(file_path):
+    file_path = task.get("output_path") or os.path.join("output", task["output_file"])
+
+    # Stat once, reusing the result for both the existence check and the
+    # response headers so Starlette doesn't stat the file again
+    try:
+        stat_result = os.stat(file_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="File not found")
-    
-    return FileResponse(
-        path=file_path, 
+
+    response = FileResponse(
+        path=file_path,
         filename=task["output_file"],
-        media_type="application/octet-stream"
+        media_type="application/octet-stream",
+        stat_result=stat_result
     )
+    # Larger chunks than Starlette's 64 KiB default mean fewer read/send
+    # loop iterations per multi-MB result file
+    response.chunk_size = 256 * 1024
+    return response
 
 @app.delete("/tasks/{task_id}")
 async def delete_task(task_id: str = Path(..., description="The ID of the task to delete")):
     """
     Delete a task and its associated data.
     """
-    if task_id not in task_store:
+    task = await task_store.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    
-    task = task_store[task_id]
-    
+
     # Delete the output file if it exists
     if "output_file" in task:
-        file_path = os.path.join("output", task["output_file"])
+        file_path = task.get("output_path") or os.path.join("output", task["output_file"])
         if os.path.exists(file_path):
             try:
                 os.remove(file_path)
@@ -280,8 +636,8 @@ async def delete_task(task_id: str = Path(..., description="The ID of the task t
                 logger.error(f"Error deleting file {file_path}: {str(e)}")
     
     # Remove the task from the store
-    del task_store[task_id]
-    
+    await task_store.delete(task_id)
+
     return {"message": "Task deleted successfully"}
 
 @app.get("/")
@@ -304,6 +660,19 @@ async def root():
 if __name__ == "__main__":
     # Make sure output directory exists
     os.makedirs("output", exist_ok=True)
-    
-    # Start the server
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+
+    if os.getenv("DEV"):
+        # Auto-reload for local development, single worker
+        uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        # uvloop + httptools for a faster event loop / HTTP parser, and
+        # multiple workers so CPU-bound handlers don't head-of-line block
+        # the service (task state is out-of-process so workers can share it)
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.getenv("WORKERS", "4")),
+            loop="uvloop",
+            http="httptools"
+        )
\ No newline at end of file
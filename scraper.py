@@ -1,21 +1,61 @@
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import csv
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import time
 import argparse
 import os
 import logging
+import re
 from datetime import datetime
+from html import unescape
 import concurrent.futures
-import pandas as pd
 import random
+from collections import Counter
 from urllib.parse import urljoin
 
+# The paginator markup on old Reddit is stable, so the next-page href can be
+# pulled straight from the raw bytes without walking the parsed tree
+NEXT_PAGE_RE = re.compile(rb'<span class="next-button"[^>]*>\s*<a[^>]+href="([^"]+)"')
+
+
+def _parse_count(text):
+    """Parse a Reddit count token like '45', '2.5k' or '1,024' into an int."""
+    token = text.replace(',', '')
+    try:
+        if token.endswith(('k', 'K')):
+            return int(float(token[:-1]) * 1000)
+        return int(token)
+    except ValueError:
+        return 0
+
 class EnhancedRedditScraper:
     """
     An advanced scraper for extracting content from Reddit subreddits.
     """
+    # Selectors for the hot extraction loops, hoisted to the class so every
+    # call site shares one string. (An earlier plan to precompile lxml XPath
+    # objects was superseded by the Lexbor port, whose selector matching is
+    # already native code.)
+    POST_SELECTOR = 'div.thing'
+    TITLE_SELECTOR = 'a.title'
+    SCORE_SELECTOR = 'div.score.unvoted'
+    AUTHOR_SELECTOR = 'a.author'
+    FLAIR_SELECTOR = 'span.linkflairlabel'
+    COMMENTS_SELECTOR = 'a.comments'
+    # Target the inner text block: the thing div itself carries the
+    # expando class, and css_first would otherwise match the whole post
+    EXPANDO_SELECTOR = 'div.expando div.md'
+    MEDIA_SELECTOR = 'a.thumbnail, div.media-preview'
+    NEXT_PAGE_SELECTOR = 'span.next-button a'
+    COMMENT_SELECTOR = 'div.entry'
+    COMMENT_TEXT_SELECTOR = 'div.md'
+    COMMENT_SCORE_SELECTOR = 'span.score'
+
     def __init__(self, subreddit, post_limit=25, output_format="csv", 
                  include_comments=False, pages=1, sort_by="hot", 
                  time_filter="all", delay=(1, 3)):
@@ -54,6 +94,34 @@ class EnhancedRedditScraper:
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:90.0) Gecko/20100101 Firefox/90.0'
         ]
         
+        # Persistent keep-alive session so TCP+TLS setup is paid once,
+        # not per page fetch
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=0
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Conditional-request cache: url -> validators plus the parsed tree,
+        # so a 304 skips both the body download and the re-parse
+        self._cond_cache = {}
+        
+        # One UA per session lifetime: keep-alive connections then present a
+        # consistent fingerprint, and retries on 429/403 rotate it explicitly
+        self._current_ua = random.choice(self.user_agents)
+        
+        # Everything except the User-Agent is constant, so build the header
+        # template once and only swap the UA per request
+        self._header_template = {
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+        }
+        
         # Configure logging
         self.setup_logging()
         
@@ -76,32 +144,39 @@ class EnhancedRedditScraper:
         )
         self.logger = logging.getLogger(__name__)
         
+    def close(self):
+        """Release the pooled HTTP connections."""
+        self.session.close()
+        
+    def __del__(self):
+        try:
+            self.session.close()
+        except Exception:
+            pass
+        
     def get_random_headers(self):
         """
-        Generate random headers for each request.
+        Build request headers using the session's current user agent.
         
         Returns:
             dict: HTTP headers
         """
-        return {
-            'User-Agent': random.choice(self.user_agents),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
+        return {'User-Agent': self._current_ua, **self._header_template}
+    
+    def rotate_user_agent(self):
+        """Pick a fresh user agent, e.g. after a 429/403 response."""
+        self._current_ua = random.choice(self.user_agents)
         
     def get_page(self, url, retries=3):
         """
-        Fetch a webpage and return the BeautifulSoup object with retry logic.
+        Fetch a webpage and return the parsed document with retry logic.
         
         Args:
             url (str): URL to fetch
             retries (int): Number of retry attempts
             
         Returns:
-            tuple: (BeautifulSoup object, URL after redirect)
+            tuple: (LexborHTMLParser tree, URL after redirect, raw body bytes)
         """
         for attempt in range(retries):
             try:
@@ -110,26 +185,63 @@ class EnhancedRedditScraper:
                 time.sleep(delay_time)
                 
                 self.logger.info(f"Fetching {url} (Attempt {attempt+1}/{retries})")
-                response = requests.get(url, headers=self.get_random_headers(), timeout=10)
+                headers = self.get_random_headers()
+                
+                # Send validators from earlier fetches of the same URL so an
+                # unchanged page comes back as a bodyless 304
+                cached = self._cond_cache.get(url)
+                if cached:
+                    if cached.get('etag'):
+                        headers['If-None-Match'] = cached['etag']
+                    if cached.get('last_modified'):
+                        headers['If-Modified-Since'] = cached['last_modified']
+                
+                response = self.session.get(url, headers=headers, timeout=10)
+                
+                if response.status_code == 304 and cached:
+                    self.logger.info(f"Not modified: {url} (reusing cached parse)")
+                    return cached['tree'], cached['final_url'], cached['content']
+                
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                return soup, response.url
+                # Lexbor parses and traverses entirely in C - an order of
+                # magnitude faster than BeautifulSoup for the find-heavy
+                # extraction loops below
+                tree = LexborHTMLParser(response.content)
+                
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if etag or last_modified:
+                    self._cond_cache[url] = {
+                        'etag': etag,
+                        'last_modified': last_modified,
+                        'tree': tree,
+                        'final_url': response.url,
+                        'content': response.content
+                    }
+                
+                return tree, response.url, response.content
                 
             except requests.exceptions.RequestException as e:
                 self.logger.error(f"Error fetching the page (Attempt {attempt+1}/{retries}): {e}")
                 if attempt == retries - 1:  # Last attempt
-                    return None, url
+                    return None, url, None
+                # Rate limits and blocks are the one case where a new UA helps
+                status = getattr(getattr(e, 'response', None), 'status_code', None)
+                if status in (403, 429):
+                    self.rotate_user_agent()
                 time.sleep(2 * (attempt + 1))  # Exponential backoff
         
-        return None, url
+        return None, url, None
     
-    def extract_posts(self, soup):
+    def extract_posts(self, tree, page_bytes=None, remaining=None):
         """
-        Extract post data from the soup object.
-        
+        Extract post data from the parsed page.
+
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            tree (LexborHTMLParser): Parsed HTML content
+            page_bytes (bytes): Raw page bytes, used for the next-page scan
+            remaining (int): Posts still needed; defaults to post_limit
             
         Returns:
             list: List of dictionaries containing post data
@@ -137,68 +249,80 @@ class EnhancedRedditScraper:
         """
         posts = []
         next_page_url = None
+        pending_comments = []
+        if remaining is None:
+            remaining = self.post_limit
+        # One timestamp per page rather than a now()+strftime per post
+        scrape_ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        if soup is None:
+        if tree is None:
             return posts, next_page_url
             
         # Find all post elements
-        post_elements = soup.find_all('div', class_='thing')
+        post_elements = tree.css(self.POST_SELECTOR)
         
         for post in post_elements:
-            if len(posts) >= self.post_limit:
+            # Stop as soon as the caller's quota is filled so excess posts
+            # never trigger comment fetches
+            if len(posts) >= remaining:
                 break
                 
             try:
                 # Extract post ID
-                post_id = post.get('id', '').replace('thing_', '')
+                post_id = (post.attributes.get('id') or '').replace('thing_', '')
                 
                 # Extract post title
-                title_element = post.find('a', class_='title')
-                title = title_element.text.strip() if title_element else "No title"
+                title_element = post.css_first(self.TITLE_SELECTOR)
+                title = title_element.text().strip() if title_element else "No title"
                 
                 # Extract post URL
-                url = title_element['href'] if title_element and 'href' in title_element.attrs else ""
+                url = title_element.attributes.get('href', '') if title_element else ""
+                url = url or ""
                 # Make absolute URL if needed
                 if url.startswith('/'):
                     url = urljoin("https://www.reddit.com", url)
                 
                 # Extract score
-                score_element = post.find('div', class_='score unvoted')
-                score = score_element.get('title', '0') if score_element else "0"
+                score_element = post.css_first(self.SCORE_SELECTOR)
+                score = (score_element.attributes.get('title') or '0') if score_element else "0"
                 
                 # Extract author
-                author_element = post.find('a', class_='author')
-                author = author_element.text.strip() if author_element else "Unknown"
+                author_element = post.css_first(self.AUTHOR_SELECTOR)
+                author = author_element.text().strip() if author_element else "Unknown"
                 
                 # Extract flair
-                flair_element = post.find('span', class_='linkflairlabel')
-                flair = flair_element.text.strip() if flair_element else ""
+                flair_element = post.css_first(self.FLAIR_SELECTOR)
+                flair = flair_element.text().strip() if flair_element else ""
                 
                 # Extract timestamp
-                time_element = post.find('time')
-                timestamp = time_element['datetime'] if time_element and 'datetime' in time_element.attrs else ""
+                time_element = post.css_first('time')
+                timestamp = (time_element.attributes.get('datetime') or '') if time_element else ""
                 
                 # Extract comments count
-                comments_element = post.find('a', class_='comments')
-                comments_text = comments_element.text.strip() if comments_element else "0 comments"
-                comments_count = comments_text.split()[0]
-                comments_url = comments_element['href'] if comments_element and 'href' in comments_element.attrs else ""
+                comments_element = post.css_first(self.COMMENTS_SELECTOR)
+                comments_text = comments_element.text().strip() if comments_element else "0 comments"
+                comments_count = _parse_count(comments_text.split()[0])
+                comments_url = (comments_element.attributes.get('href') or '') if comments_element else ""
+                
+                # Post flags live in the class attribute; one frozenset
+                # gives O(1) membership for the three flag checks below
+                post_classes = frozenset((post.attributes.get('class') or '').split())
                 
                 # Check if this is a self post
-                is_self = 'self' in post.get('class', [])
+                is_self = 'self' in post_classes
                 
                 # Extract post content (if it's a self post)
                 content = ""
-                if is_self and 'expando' in post.get('class', []):
-                    content_element = post.find('div', class_='expando')
+                if is_self and 'expando' in post_classes:
+                    content_element = post.css_first(self.EXPANDO_SELECTOR)
                     if content_element:
-                        content = content_element.text.strip()
+                        content = content_element.text().strip()
                 
                 # Extract if post is stickied
-                is_stickied = 'stickied' in post.get('class', [])
+                is_stickied = 'stickied' in post_classes
                 
                 # Check if post has media (image/video)
-                has_media = bool(post.find('a', class_='thumbnail') or post.find('div', class_='media-preview'))
+                has_media = bool(post.css_first(self.MEDIA_SELECTOR))
                 
                 # Create a post dictionary
                 post_data = {
@@ -206,7 +330,7 @@ class EnhancedRedditScraper:
                     'title': title,
                     'author': author,
                     'score': score,
-                    'comments_count': comments_count.replace('k', '000') if 'k' in comments_count else comments_count,
+                    'comments_count': comments_count,
                     'post_url': url,
                     'comments_url': comments_url,
                     'timestamp': timestamp,
@@ -215,12 +339,12 @@ class EnhancedRedditScraper:
                     'is_stickied': is_stickied,
                     'has_media': has_media,
                     'content': content,
-                    'scrape_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    'scrape_time': scrape_ts
                 }
                 
-                # Add comments if requested
+                # Comment pages are fetched in parallel after the sweep
                 if self.include_comments and comments_url:
-                    post_data['comments'] = self.extract_comments(comments_url)
+                    pending_comments.append((len(posts), comments_url))
                 
                 posts.append(post_data)
                 
@@ -228,12 +352,33 @@ class EnhancedRedditScraper:
                 self.logger.error(f"Error extracting post data: {e}")
                 continue
         
-        # Find next page button
-        next_button = soup.find('span', class_='next-button')
-        if next_button:
-            next_link = next_button.find('a')
-            if next_link and 'href' in next_link.attrs:
-                next_page_url = next_link['href']
+        # Fan comment fetches out across threads so their round trips and
+        # politeness delays overlap (the randomized delay still applies
+        # inside get_page, per thread; Session.get is thread-safe)
+        if pending_comments:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {
+                    executor.submit(self.extract_comments, url): index
+                    for index, url in pending_comments
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    index = futures[future]
+                    try:
+                        posts[index]['comments'] = future.result()
+                    except Exception as e:
+                        self.logger.warning(f"Error fetching comments: {e}")
+                        posts[index]['comments'] = []
+        
+        # Find the next page URL with a byte-level scan; walking the tree
+        # for one href is only needed if the markup ever shifts
+        if page_bytes:
+            match = NEXT_PAGE_RE.search(page_bytes)
+            if match:
+                next_page_url = unescape(match.group(1).decode('utf-8', 'replace'))
+        if next_page_url is None:
+            next_link = tree.css_first(self.NEXT_PAGE_SELECTOR)
+            if next_link:
+                next_page_url = next_link.attributes.get('href')
                 
         return posts, next_page_url
     
@@ -255,25 +400,25 @@ class EnhancedRedditScraper:
         comments = []
         
         try:
-            soup, actual_url = self.get_page(url)
-            if soup is None:
+            tree, actual_url, _ = self.get_page(url)
+            if tree is None:
                 return comments
                 
-            comment_elements = soup.find_all('div', class_='entry')[:max_comments]
+            comment_elements = tree.css(self.COMMENT_SELECTOR)[:max_comments]
             
             for comment in comment_elements:
                 try:
-                    author_element = comment.find('a', class_='author')
-                    author = author_element.text.strip() if author_element else "Unknown"
+                    author_element = comment.css_first(self.AUTHOR_SELECTOR)
+                    author = author_element.text().strip() if author_element else "Unknown"
                     
-                    text_element = comment.find('div', class_='md')
-                    text = text_element.text.strip() if text_element else ""
+                    text_element = comment.css_first(self.COMMENT_TEXT_SELECTOR)
+                    text = text_element.text().strip() if text_element else ""
                     
-                    score_element = comment.find('span', class_='score')
-                    score = score_element.text.strip() if score_element else "0 points"
+                    score_element = comment.css_first(self.COMMENT_SCORE_SELECTOR)
+                    score = score_element.text().strip() if score_element else "0 points"
                     
-                    time_element = comment.find('time')
-                    timestamp = time_element['datetime'] if time_element and 'datetime' in time_element.attrs else ""
+                    time_element = comment.css_first('time')
+                    timestamp = (time_element.attributes.get('datetime') or '') if time_element else ""
                     
                     comment_data = {
                         'author': author,
@@ -325,8 +470,19 @@ class EnhancedRedditScraper:
                 # Flatten nested comment structures for CSV
                 flattened_posts = self._flatten_posts_for_csv(posts)
                 
-                df = pd.DataFrame(flattened_posts)
-                df.to_csv(csv_path, index=False, encoding='utf-8')
+                # DictWriter writes the flat dicts directly - building a
+                # DataFrame (and importing pandas) just to call to_csv cost
+                # far more memory than the rows themselves
+                fieldnames = []
+                for post in flattened_posts:
+                    for key in post:
+                        if key not in fieldnames:
+                            fieldnames.append(key)
+                
+                with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csv_file:
+                    writer = csv.DictWriter(csv_file, fieldnames=fieldnames, restval='')
+                    writer.writeheader()
+                    writer.writerows(flattened_posts)
                 self.logger.info(f"Data saved to {csv_path}")
                 return csv_path
             except Exception as e:
@@ -336,14 +492,35 @@ class EnhancedRedditScraper:
         elif self.output_format == "json":
             json_path = f"{file_path}.json"
             try:
-                with open(json_path, 'w', encoding='utf-8') as json_file:
-                    json.dump(posts, json_file, indent=4, ensure_ascii=False)
+                # Compact ascii output: indent=4 plus ensure_ascii=False took
+                # the slow path of the C encoder and held the whole
+                # pretty-printed string in memory
+                if orjson is not None:
+                    with open(json_path, 'wb') as json_file:
+                        json_file.write(orjson.dumps(posts))
+                else:
+                    with open(json_path, 'w', encoding='utf-8') as json_file:
+                        json.dump(posts, json_file, ensure_ascii=True)
                 self.logger.info(f"Data saved to {json_path}")
                 return json_path
             except Exception as e:
                 self.logger.error(f"Error saving to JSON: {e}")
                 return None
                 
+        elif self.output_format == "jsonl":
+            jsonl_path = f"{file_path}.jsonl"
+            try:
+                # One record per line through a 1 MiB buffer - memory stays
+                # flat no matter how large the scrape is
+                with open(jsonl_path, 'w', encoding='utf-8', buffering=1 << 20) as jsonl_file:
+                    for post in posts:
+                        jsonl_file.write(json.dumps(post, ensure_ascii=True) + "\n")
+                self.logger.info(f"Data saved to {jsonl_path}")
+                return jsonl_path
+            except Exception as e:
+                self.logger.error(f"Error saving to JSONL: {e}")
+                return None
+                
         elif self.output_format == "txt":
             txt_path = f"{file_path}.txt"
             try:
@@ -413,25 +590,40 @@ class EnhancedRedditScraper:
         return {}
         
      try:
-        # Convert to pandas DataFrame for easier analysis
-        df = pd.DataFrame(posts)
+        # numpy is only needed for analytics, so it's imported here rather
+        # than at module load - plain scrape runs never pay for it
+        import numpy as np
+        
+        # Scores go through a single float64 array so mean/median/max/min are
+        # each one C-level pass; counts come from Counter instead of pandas
+        # object-column reductions over a DataFrame
+        def to_float(value):
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return np.nan
+        
+        scores = np.fromiter(
+            (to_float(post.get('score')) for post in posts),
+            dtype=np.float64, count=len(posts)
+        )
         
-        # Convert score to numeric
-        df['score_num'] = pd.to_numeric(df['score'], errors='coerce')
+        author_counts = Counter(post.get('author', 'Unknown') for post in posts)
+        flair_counts = Counter(post.get('flair', '') for post in posts)
         
         # Basic statistics
         analytics = {
-            'total_posts': int(len(posts)),
-            'unique_authors': int(df['author'].nunique()),
-            'average_score': float(df['score_num'].mean()),
-            'median_score': float(df['score_num'].median()),
-            'max_score': float(df['score_num'].max()),
-            'min_score': float(df['score_num'].min()),
-            'stickied_posts': int(df['is_stickied'].sum()) if 'is_stickied' in df else 0,
-            'self_posts_percentage': float(df['is_self_post'].sum() / len(df) * 100) if 'is_self_post' in df else 0,
-            'posts_with_media_percentage': float(df['has_media'].sum() / len(df) * 100) if 'has_media' in df else 0,
-            'top_authors': {k: int(v) for k, v in df['author'].value_counts().head(5).to_dict().items()},
-            'flair_distribution': {k: int(v) for k, v in df['flair'].value_counts().head(10).to_dict().items()} if 'flair' in df else {},
+            'total_posts': len(posts),
+            'unique_authors': len(author_counts),
+            'average_score': float(np.nanmean(scores)),
+            'median_score': float(np.nanmedian(scores)),
+            'max_score': float(np.nanmax(scores)),
+            'min_score': float(np.nanmin(scores)),
+            'stickied_posts': sum(1 for post in posts if post.get('is_stickied')),
+            'self_posts_percentage': sum(1 for post in posts if post.get('is_self_post')) / len(posts) * 100,
+            'posts_with_media_percentage': sum(1 for post in posts if post.get('has_media')) / len(posts) * 100,
+            'top_authors': dict(author_counts.most_common(5)),
+            'flair_distribution': dict(flair_counts.most_common(10)),
         }
         
         # Save analytics to file
@@ -443,7 +635,7 @@ class EnhancedRedditScraper:
         analytics_path = os.path.join(output_dir, f"{self.subreddit}_analytics_{timestamp}.json")
         
         with open(analytics_path, 'w', encoding='utf-8') as f:
-            json.dump(analytics, f, indent=4)
+            json.dump(analytics, f)
             
         self.logger.info(f"Analytics saved to {analytics_path}")
         return analytics
@@ -464,24 +656,45 @@ class EnhancedRedditScraper:
         all_posts = []
         current_url = self.base_url
         page = 1
+        in_flight = None
         
-        while page <= self.pages and len(all_posts) < self.post_limit:
-            self.logger.info(f"Scraping page {page} of r/{self.subreddit}")
-            
-            soup, actual_url = self.get_page(current_url)
-            if soup is None:
-                break
+        # Single-slot prefetch pipeline: page N+1 is fetched while page N is
+        # being parsed, hiding parse time behind network latency
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as prefetcher:
+            while page <= self.pages and len(all_posts) < self.post_limit:
+                self.logger.info(f"Scraping page {page} of r/{self.subreddit}")
                 
-            posts, next_page_url = self.extract_posts(soup)
-            all_posts.extend(posts[:self.post_limit - len(all_posts)])
-            
-            self.logger.info(f"Scraped {len(posts)} posts from page {page}")
-            
-            if not next_page_url or len(all_posts) >= self.post_limit:
-                break
+                if in_flight is not None:
+                    tree, actual_url, content = in_flight.result()
+                    in_flight = None
+                else:
+                    tree, actual_url, content = self.get_page(current_url)
+                if tree is None:
+                    break
+                
+                # The paginator href comes from the raw bytes, so the next
+                # fetch can start before this page is parsed
+                next_page_url = None
+                if content:
+                    match = NEXT_PAGE_RE.search(content)
+                    if match:
+                        next_page_url = unescape(match.group(1).decode('utf-8', 'replace'))
+                if next_page_url and page < self.pages:
+                    in_flight = prefetcher.submit(self.get_page, next_page_url)
                 
-            current_url = next_page_url
-            page += 1
+                posts, parsed_next = self.extract_posts(
+                    tree, content, remaining=self.post_limit - len(all_posts)
+                )
+                next_page_url = next_page_url or parsed_next
+                all_posts.extend(posts)
+                
+                self.logger.info(f"Scraped {len(posts)} posts from page {page}")
+                
+                if not next_page_url or len(all_posts) >= self.post_limit:
+                    break
+                    
+                current_url = next_page_url
+                page += 1
         
         self.logger.info(f"Finished scraping. Total posts: {len(all_posts)}")
         
@@ -515,7 +728,7 @@ def main():
     parser = argparse.ArgumentParser(description='Enhanced Reddit Scraper')
     parser.add_argument('subreddit', type=str, help='Subreddit to scrape')
     parser.add_argument('--limit', type=int, default=25, help='Maximum number of posts to scrape')
-    parser.add_argument('--format', type=str, choices=['csv', 'txt', 'json'], default='csv', help='Output format')
+    parser.add_argument('--format', type=str, choices=['csv', 'txt', 'json', 'jsonl'], default='csv', help='Output format')
     parser.add_argument('--output', type=str, help='Output filename (without extension)')
     parser.add_argument('--comments', action='store_true', help='Include comments')
     parser.add_argument('--pages', type=int, default=1, help='Number of pages to scrape')
@@ -0,0 +1,339 @@
+import json
+import os
+import time
+import logging
+from typing import Protocol, Optional, List, Dict, Any
+
+logger = logging.getLogger("reddit_api.task_store")
+
+# Tasks in a terminal state (completed/failed) are kept around for this long
+TASK_TTL_SECONDS = int(os.getenv("TASK_TTL", "86400"))
+
+# States after which a task can be expired
+TERMINAL_STATES = ("completed", "failed")
+
+
+class TaskStore(Protocol):
+    """
+    Storage backend for scraping task state.
+
+    Analytics blobs are stored separately from the task record so the
+    common status-polling path never has to deserialize them.
+    """
+
+    async def setup(self) -> None: ...
+
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]: ...
+
+    async def set(self, task_id: str, task: Dict[str, Any]) -> None: ...
+
+    async def update(self, task_id: str, patch: Dict[str, Any]) -> None: ...
+
+    async def delete(self, task_id: str) -> bool: ...
+
+    async def list(self) -> List[Dict[str, Any]]: ...
+
+    async def set_analytics(self, task_id: str, analytics: Dict[str, Any]) -> None: ...
+
+    async def get_analytics(self, task_id: str) -> Optional[Dict[str, Any]]: ...
+
+    async def set_parameters(self, task_id: str, parameters: Dict[str, Any]) -> None: ...
+
+    async def get_parameters(self, task_id: str) -> Optional[Dict[str, Any]]: ...
+
+    async def sweep(self) -> int: ...
+
+    async def close(self) -> None: ...
+
+
+class SqliteTaskStore:
+    """
+    Zero-dependency default store backed by aiosqlite.
+
+    One row per task with the serialized task record, an optional analytics
+    blob and an expiry column. Expired rows are removed by sweep(), which
+    the app runs periodically.
+    """
+
+    def __init__(self, db_path: str = None, ttl: int = TASK_TTL_SECONDS):
+        self.db_path = db_path or os.getenv("TASK_DB_PATH", "tasks.db")
+        self.ttl = ttl
+        self._db = None
+
+    async def setup(self):
+        import aiosqlite
+        self._db = await aiosqlite.connect(self.db_path)
+        await self._db.execute(
+            """CREATE TABLE IF NOT EXISTS tasks (
+                task_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                analytics TEXT,
+                parameters TEXT,
+                expires_at REAL
+            )"""
+        )
+        await self._db.commit()
+
+    async def get(self, task_id):
+        cursor = await self._db.execute(
+            "SELECT data FROM tasks WHERE task_id = ?", (task_id,)
+        )
+        row = await cursor.fetchone()
+        return json.loads(row[0]) if row else None
+
+    async def set(self, task_id, task):
+        await self._db.execute(
+            "INSERT OR REPLACE INTO tasks (task_id, data, expires_at) VALUES (?, ?, NULL)",
+            (task_id, json.dumps(task)),
+        )
+        await self._db.commit()
+
+    async def update(self, task_id, patch):
+        task = await self.get(task_id)
+        if task is None:
+            return
+        task.update(patch)
+        expires_at = None
+        if task.get("status") in TERMINAL_STATES:
+            expires_at = time.time() + self.ttl
+        await self._db.execute(
+            "UPDATE tasks SET data = ?, expires_at = ? WHERE task_id = ?",
+            (json.dumps(task), expires_at, task_id),
+        )
+        await self._db.commit()
+
+    async def delete(self, task_id):
+        cursor = await self._db.execute(
+            "DELETE FROM tasks WHERE task_id = ?", (task_id,)
+        )
+        await self._db.commit()
+        return cursor.rowcount > 0
+
+    async def list(self):
+        cursor = await self._db.execute("SELECT data FROM tasks")
+        rows = await cursor.fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    async def set_analytics(self, task_id, analytics):
+        await self._db.execute(
+            "UPDATE tasks SET analytics = ? WHERE task_id = ?",
+            (json.dumps(analytics), task_id),
+        )
+        await self._db.commit()
+
+    async def get_analytics(self, task_id):
+        cursor = await self._db.execute(
+            "SELECT analytics FROM tasks WHERE task_id = ?", (task_id,)
+        )
+        row = await cursor.fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    async def set_parameters(self, task_id, parameters):
+        await self._db.execute(
+            "UPDATE tasks SET parameters = ? WHERE task_id = ?",
+            (json.dumps(parameters), task_id),
+        )
+        await self._db.commit()
+
+    async def get_parameters(self, task_id):
+        cursor = await self._db.execute(
+            "SELECT parameters FROM tasks WHERE task_id = ?", (task_id,)
+        )
+        row = await cursor.fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    async def sweep(self):
+        cursor = await self._db.execute(
+            "DELETE FROM tasks WHERE expires_at IS NOT NULL AND expires_at < ?",
+            (time.time(),),
+        )
+        await self._db.commit()
+        if cursor.rowcount:
+            logger.info(f"Swept {cursor.rowcount} expired tasks")
+        return cursor.rowcount
+
+    async def close(self):
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+
+class RedisTaskStore:
+    """
+    Redis-backed store for multi-worker deployments.
+
+    Task records live in one hash per task with field values JSON-encoded;
+    analytics go to a side key. Terminal tasks get an EXPIRE so Redis
+    evicts them without any sweeping on our side.
+    """
+
+    def __init__(self, url: str = None, ttl: int = TASK_TTL_SECONDS):
+        self.url = url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self.ttl = ttl
+        self._redis = None
+
+    @staticmethod
+    def _key(task_id):
+        return f"task:{task_id}"
+
+    @staticmethod
+    def _analytics_key(task_id):
+        return f"task:{task_id}:analytics"
+
+    @staticmethod
+    def _parameters_key(task_id):
+        return f"task:{task_id}:parameters"
+
+    async def setup(self):
+        import redis.asyncio as aioredis
+        self._redis = aioredis.from_url(self.url, decode_responses=True)
+        await self._redis.ping()
+
+    async def get(self, task_id):
+        raw = await self._redis.hgetall(self._key(task_id))
+        if not raw:
+            return None
+        return {k: json.loads(v) for k, v in raw.items()}
+
+    async def set(self, task_id, task):
+        pipe = self._redis.pipeline()
+        pipe.hset(self._key(task_id), mapping={k: json.dumps(v) for k, v in task.items()})
+        pipe.sadd("task_ids", task_id)
+        await pipe.execute()
+
+    async def update(self, task_id, patch):
+        pipe = self._redis.pipeline()
+        pipe.hset(self._key(task_id), mapping={k: json.dumps(v) for k, v in patch.items()})
+        if patch.get("status") in TERMINAL_STATES:
+            pipe.expire(self._key(task_id), self.ttl)
+            pipe.expire(self._analytics_key(task_id), self.ttl)
+            pipe.expire(self._parameters_key(task_id), self.ttl)
+        await pipe.execute()
+
+    async def delete(self, task_id):
+        pipe = self._redis.pipeline()
+        pipe.delete(self._key(task_id))
+        pipe.delete(self._analytics_key(task_id))
+        pipe.delete(self._parameters_key(task_id))
+        pipe.srem("task_ids", task_id)
+        results = await pipe.execute()
+        return results[0] > 0
+
+    async def list(self):
+        task_ids = await self._redis.smembers("task_ids")
+        tasks = []
+        for task_id in task_ids:
+            task = await self.get(task_id)
+            if task is None:
+                # Expired by Redis but still in the index set
+                await self._redis.srem("task_ids", task_id)
+                continue
+            tasks.append(task)
+        return tasks
+
+    async def set_analytics(self, task_id, analytics):
+        await self._redis.set(self._analytics_key(task_id), json.dumps(analytics))
+
+    async def get_analytics(self, task_id):
+        raw = await self._redis.get(self._analytics_key(task_id))
+        return json.loads(raw) if raw else None
+
+    async def set_parameters(self, task_id, parameters):
+        await self._redis.set(self._parameters_key(task_id), json.dumps(parameters))
+
+    async def get_parameters(self, task_id):
+        raw = await self._redis.get(self._parameters_key(task_id))
+        return json.loads(raw) if raw else None
+
+    async def sweep(self):
+        # Redis handles expiry itself; just prune dangling index entries
+        swept = 0
+        for task_id in await self._redis.smembers("task_ids"):
+            if not await self._redis.exists(self._key(task_id)):
+                await self._redis.srem("task_ids", task_id)
+                swept += 1
+        return swept
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+class MemoryTaskStore:
+    """
+    In-process fallback used when neither Redis nor aiosqlite is available.
+
+    Backed by TTLCache so memory stays bounded: old tasks are evicted
+    once the cache hits its size cap or their TTL lapses, matching the
+    TTL behaviour of the other backends.
+    """
+
+    def __init__(self, maxsize: int = None, ttl: int = TASK_TTL_SECONDS):
+        from cachetools import TTLCache
+        maxsize = maxsize or int(os.getenv("TASK_CACHE_MAX", "10000"))
+        self._tasks = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._analytics = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._parameters = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def setup(self):
+        pass
+
+    async def get(self, task_id):
+        task = self._tasks.get(task_id)
+        return dict(task) if task is not None else None
+
+    async def set(self, task_id, task):
+        self._tasks[task_id] = dict(task)
+
+    async def update(self, task_id, patch):
+        task = self._tasks.get(task_id)
+        if task is not None:
+            task.update(patch)
+
+    async def delete(self, task_id):
+        existed = task_id in self._tasks
+        self._tasks.pop(task_id, None)
+        self._analytics.pop(task_id, None)
+        self._parameters.pop(task_id, None)
+        return existed
+
+    async def list(self):
+        return [dict(task) for task in self._tasks.values()]
+
+    async def set_analytics(self, task_id, analytics):
+        self._analytics[task_id] = analytics
+
+    async def get_analytics(self, task_id):
+        return self._analytics.get(task_id)
+
+    async def set_parameters(self, task_id, parameters):
+        self._parameters[task_id] = parameters
+
+    async def get_parameters(self, task_id):
+        return self._parameters.get(task_id)
+
+    async def sweep(self):
+        # TTLCache evicts lazily; expire() forces it so list() stays honest
+        self._tasks.expire()
+        self._analytics.expire()
+        self._parameters.expire()
+        return 0
+
+    async def close(self):
+        pass
+
+
+def get_task_store() -> TaskStore:
+    """
+    Pick a store backend: Redis when REDIS_URL is set, SQLite when
+    aiosqlite is installed, a bounded in-memory cache otherwise.
+    """
+    if os.getenv("REDIS_URL"):
+        return RedisTaskStore()
+    try:
+        import aiosqlite  # noqa: F401
+        return SqliteTaskStore()
+    except ImportError:
+        logger.warning("aiosqlite not installed; falling back to in-memory task store")
+        return MemoryTaskStore()
@@ -0,0 +1,865 @@
+import unittest
+import asyncio
+import concurrent.futures
+import pytest
+import requests
+import httpx
+import json
+import orjson
+import time
+import os
+import sys
+from datetime import datetime
+from types import MappingProxyType
+import logging
+import logging.handlers
+
+# Configure logging. The log file is opt-in (TEST_LOG_FILE=path): CI never
+# reads it, and the handler sits behind a MemoryHandler so the wait loops
+# don't pay a write+flush per record - batches land on ERROR or at exit
+handlers = [logging.StreamHandler()]
+if os.getenv("TEST_LOG_FILE"):
+    handlers.append(logging.handlers.MemoryHandler(
+        capacity=256,
+        flushLevel=logging.ERROR,
+        target=logging.FileHandler(os.getenv("TEST_LOG_FILE")),
+    ))
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s %(levelname)s %(message)s',
+    handlers=handlers,
+)
+logger = logging.getLogger("api_tests")
+
+# API Base URL - Change this to match your deployment
+API_BASE_URL = "http://localhost:8000"
+
+# Canned Reddit pages for the mocked tests
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# The live-server tests scrape real Reddit and can take minutes; they only
+# run when explicitly requested
+E2E_ENABLED = os.environ.get("RUN_E2E") == "1"
+
+# Every scrape test posts a variation of the same request body; build them
+# from one read-only template so a new field is a one-line change
+_BASE_PAYLOAD = MappingProxyType({
+    "subreddit": "python",
+    "post_limit": 5,
+    "output_format": "json",
+    "include_comments": False,
+    "pages": 1,
+    "sort_by": "hot",
+    "time_filter": "day",
+    "delay_min": 1.0,
+    "delay_max": 2.0,
+})
+
+def make_payload(**overrides):
+    """Return a scrape payload: the shared defaults plus any overrides."""
+    return {**_BASE_PAYLOAD, **overrides}
+
+# The in-process test classes share one task database location; the app
+# binds TASK_DB_PATH when `main` is first imported, so it must be set once
+# and left alone for the whole run (cleaned up at interpreter exit)
+_test_db_dir = None
+
+def ensure_test_db_path():
+    global _test_db_dir
+    if _test_db_dir is None:
+        import tempfile
+        _test_db_dir = tempfile.TemporaryDirectory()
+        os.environ.setdefault("TASK_DB_PATH", os.path.join(_test_db_dir.name, "tasks.db"))
+
+
+def wait_for_task(session, task_id, *, timeout=60, first_interval=0.2, max_interval=5.0, base_url=API_BASE_URL):
+    """
+    Wait for a task to reach a terminal state.
+    
+    Long-polls the status endpoint when the server supports it and falls
+    back to adaptive sleeping otherwise. Works with any requests-style
+    client (a pooled Session or a TestClient).
+    
+    Args:
+        session: HTTP client exposing get()
+        task_id (str): The ID of the task to wait for
+        timeout (int): Maximum time to wait in seconds
+        first_interval (float): Initial fallback poll interval
+        max_interval (float): Fallback poll interval cap
+        base_url (str): Server base URL
+        
+    Returns:
+        bool: True if task completed, False if timed out
+    """
+    deadline = time.perf_counter() + timeout
+    long_poll = True
+    interval = first_interval
+    while time.perf_counter() < deadline:
+        try:
+            if long_poll:
+                # The server holds this request open until the task
+                # finishes, so transitions are seen immediately
+                started = time.perf_counter()
+                response = session.get(f"{base_url}/tasks/{task_id}?wait=10", timeout=(3, 15))
+            else:
+                response = session.get(f"{base_url}/tasks/{task_id}", timeout=(3, 10))
+            if long_poll and response.status_code in (400, 405, 422):
+                # Server that rejects the wait param; fall back to sleeping
+                long_poll = False
+                continue
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                if data["status"] in ["completed", "failed"]:
+                    return True
+                if long_poll and time.perf_counter() - started < 1.0:
+                    # A long-polling server returns a non-terminal 200 only
+                    # after holding the request for the wait window; an
+                    # instant one means ?wait= was ignored (FastAPI drops
+                    # undeclared params) - fall back to sleeping
+                    long_poll = False
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Task %s status: %s", task_id, data["status"])
+            else:
+                # Errors return immediately, so pause instead of hammering
+                logger.warning(f"Failed to get task status: {response.status_code}")
+                time.sleep(interval)
+                interval = min(interval * 1.5, max_interval)
+        except Exception as e:
+            # A refused connection fails instantly; back off before the
+            # retry instead of busy-spinning failed connects
+            logger.error(f"Error checking task status: {str(e)}")
+            time.sleep(interval)
+            interval = min(interval * 1.5, max_interval)
+            continue
+        
+        if not long_poll:
+            time.sleep(interval)
+            interval = min(interval * 1.5, max_interval)
+    
+    logger.warning(f"Task {task_id} did not complete within {timeout} seconds")
+    return False
+
+
+async def async_wait_for_task(client, task_id, timeout=60):
+    """
+    Async counterpart of the polling helpers: long-poll the status
+    endpoint until the task reaches a terminal state or the timeout lapses.
+    """
+    deadline = time.perf_counter() + timeout
+    long_poll = True
+    # Adaptive fallback cadence: quick first checks, sparse later ones
+    interval = 0.2
+    while time.perf_counter() < deadline:
+        try:
+            if long_poll:
+                started = time.perf_counter()
+                response = await client.get(f"/tasks/{task_id}", params={"wait": 10})
+            else:
+                response = await client.get(f"/tasks/{task_id}")
+            if long_poll and response.status_code in (400, 405, 422):
+                # Server that rejects the wait param; fall back to sleeping
+                long_poll = False
+                continue
+            if response.status_code == 200:
+                if orjson.loads(response.content)["status"] in ("completed", "failed"):
+                    return True
+                if long_poll and time.perf_counter() - started < 1.0:
+                    # Instant non-terminal 200: the server ignored ?wait=,
+                    # so sleep between polls instead of hammering it
+                    long_poll = False
+            else:
+                # Errors return immediately, so pause instead of hammering
+                logger.warning(f"Failed to get task status: {response.status_code}")
+                await asyncio.sleep(interval)
+                interval = min(interval * 1.5, 5.0)
+        except Exception as e:
+            # A refused connection fails instantly; back off before the
+            # retry instead of busy-spinning failed connects
+            logger.error(f"Error checking task status: {str(e)}")
+            await asyncio.sleep(interval)
+            interval = min(interval * 1.5, 5.0)
+            continue
+        if not long_poll:
+            await asyncio.sleep(interval)
+            interval = min(interval * 1.5, 5.0)
+    logger.warning(f"Task {task_id} did not complete within {timeout} seconds")
+    return False
+
+
+@pytest.mark.xdist_group("sync_api")
+class RedditScraperAPITests(unittest.TestCase):
+    """Test suite for the Reddit Scraper API"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Dispatch requests straight into the app over ASGI by default, so no
+        sockets or separate server are involved; LIVE=1 switches to a pooled
+        keep-alive session against API_BASE_URL for end-to-end smoke runs.
+        Absolute URLs and (connect, read) timeouts work on both clients.
+        """
+        cls._live = os.environ.get("LIVE") == "1"
+        if cls._live:
+            cls.http = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=10, pool_maxsize=20, max_retries=0
+            )
+            cls.http.mount("http://", adapter)
+            cls.http.headers.update({"Connection": "keep-alive"})
+        else:
+            from fastapi.testclient import TestClient
+            ensure_test_db_path()
+            import main
+            cls.http = TestClient(main.app)
+            cls.http.__enter__()
+    
+    @classmethod
+    def tearDownClass(cls):
+        if cls._live:
+            cls.http.close()
+        else:
+            cls.http.__exit__(None, None, None)
+    
+    def setUp(self):
+        """Set up test case"""
+        self.task_ids = []  # Store task IDs for cleanup
+        
+    def tearDown(self):
+        """Clean up after test case"""
+        if not self.task_ids:
+            return
+        
+        # The deletes are independent, so fan them out over the pooled
+        # session instead of paying one round trip after another
+        def delete(task_id):
+            try:
+                response = self.http.delete(f"{API_BASE_URL}/tasks/{task_id}", timeout=(3, 10))
+                if response.status_code == 200:
+                    logger.info(f"Successfully deleted task {task_id}")
+                else:
+                    logger.warning(f"Failed to delete task {task_id}: {response.status_code}")
+            except (requests.RequestException, httpx.HTTPError) as e:
+                # Only transport failures are expected here; anything else
+                # should surface rather than be swallowed by cleanup
+                logger.error(f"Error deleting task {task_id}: {str(e)}")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(self.task_ids))) as executor:
+            list(executor.map(delete, self.task_ids))
+    
+    def test_root_endpoint(self):
+        """Test the root endpoint"""
+        response = self.http.get(f"{API_BASE_URL}/", timeout=(3, 10))
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["name"], "Reddit Scraper API")
+        self.assertIn("version", data)
+        self.assertIn("endpoints", data)
+    
+    @unittest.skipUnless(E2E_ENABLED, "E2E disabled; set RUN_E2E=1 to scrape real Reddit")
+    def test_basic_scrape(self):
+        """Test a basic scraping task"""
+        payload = make_payload()
+        
+        # Start the task
+        response = self.http.post(
+            f"{API_BASE_URL}/scrape",
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=(3, 10),
+        )
+        self.assertEqual(response.status_code, 202)
+        
+        data = response.json()
+        self.assertIn("task_id", data)
+        self.assertEqual(data["status"], "pending")
+        self.assertEqual(data["subreddit"], "python")
+        
+        # Save task ID for cleanup
+        task_id = data["task_id"]
+        self.task_ids.append(task_id)
+        
+        # Wait for task to complete (with timeout)
+        task_completed = self._wait_for_task_completion(task_id, timeout=60)
+        self.assertTrue(task_completed, "Task did not complete within the timeout period")
+        
+        # Get task status with analytics
+        response = self.http.get(f"{API_BASE_URL}/tasks/{task_id}?include_analytics=true", timeout=(3, 10))
+        self.assertEqual(response.status_code, 200)
+        
+        task_data = response.json()
+        self.assertEqual(task_data["status"], "completed")
+        self.assertIn("output_file", task_data)
+        self.assertIn("analytics", task_data)
+        
+        # A HEAD request is enough to know the result is downloadable
+        # without pulling the whole file into memory
+        response = self.http.head(f"{API_BASE_URL}/download/{task_id}", timeout=(3, 10))
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(int(response.headers.get("content-length", "0")), 0)
+    
+    @unittest.skipUnless(E2E_ENABLED, "E2E disabled; set RUN_E2E=1 to scrape real Reddit")
+    def test_invalid_subreddit(self):
+        """Test scraping an invalid subreddit"""
+        payload = make_payload(subreddit="this_subreddit_does_not_exist_12345")
+        
+        # Start the task
+        response = self.http.post(
+            f"{API_BASE_URL}/scrape",
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=(3, 10),
+        )
+        self.assertEqual(response.status_code, 202)
+        
+        data = response.json()
+        task_id = data["task_id"]
+        self.task_ids.append(task_id)
+        
+        # Wait for task to complete
+        task_completed = self._wait_for_task_completion(task_id, timeout=30)
+        self.assertTrue(task_completed, "Task did not complete within the timeout period")
+        
+        # Check task status
+        response = self.http.get(f"{API_BASE_URL}/tasks/{task_id}", timeout=(3, 10))
+        self.assertEqual(response.status_code, 200)
+        
+        task_data = response.json()
+        # Either task should fail or return empty results
+        if task_data["status"] == "failed":
+            self.assertIn("error", task_data)
+        else:
+            self.assertEqual(task_data["status"], "completed")
+            self.assertEqual(task_data.get("post_count", 0), 0)
+    
+    @unittest.skipUnless(E2E_ENABLED, "E2E disabled; set RUN_E2E=1 to scrape real Reddit")
+    def test_include_comments(self):
+        """Test scraping with comments included"""
+        payload = make_payload(
+            subreddit="AskReddit",
+            post_limit=3,
+            include_comments=True,
+            sort_by="top",
+            time_filter="week",
+        )
+        
+        # Start the task
+        response = self.http.post(
+            f"{API_BASE_URL}/scrape",
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=(3, 10),
+        )
+        self.assertEqual(response.status_code, 202)
+        
+        data = response.json()
+        task_id = data["task_id"]
+        self.task_ids.append(task_id)
+        
+        # Wait for task to complete (with timeout)
+        task_completed = self._wait_for_task_completion(task_id, timeout=120)  # Longer timeout since comments take time
+        self.assertTrue(task_completed, "Task did not complete within the timeout period")
+        
+        # Stream the download so the body is parsed without an extra
+        # full-size .content buffer
+        with self.http.get(f"{API_BASE_URL}/download/{task_id}", timeout=(3, 30), stream=True) as response:
+            self.assertEqual(response.status_code, 200)
+            try:
+                # Comment trees can be large; orjson parses them far faster
+                # than the stdlib decoder behind response.json()
+                content = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                self.fail("Response content is not valid JSON")
+        
+        self.assertTrue(len(content) > 0)
+        
+        # Check if comments were included
+        if len(content) > 0:
+            self.assertIn("comments", content[0], "Comments were not included in the response")
+    
+    @unittest.skipUnless(E2E_ENABLED, "E2E disabled; set RUN_E2E=1 to scrape real Reddit")
+    def test_get_all_tasks(self):
+        """Test retrieving all tasks"""
+        # Submitting here starts an unmocked scrape, so this only runs in
+        # E2E mode; MockScraperAPITests covers /tasks and ids= by default
+        payload = make_payload(post_limit=2)
+        
+        response = self.http.post(
+            f"{API_BASE_URL}/scrape",
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=(3, 10),
+        )
+        self.assertEqual(response.status_code, 202)
+        
+        data = response.json()
+        task_id = data["task_id"]
+        self.task_ids.append(task_id)
+        
+        # Get all tasks
+        response = self.http.get(f"{API_BASE_URL}/tasks", timeout=(3, 10))
+        self.assertEqual(response.status_code, 200)
+
+        tasks = response.json()
+        self.assertIsInstance(tasks, list)
+
+        # Check if our task is in the list (set: one hash lookup, not a scan)
+        self.assertIn(task_id, {task["task_id"] for task in tasks})
+
+        # Point lookup via the ids filter skips the full-list scan entirely
+        response = self.http.get(f"{API_BASE_URL}/tasks", params={"ids": task_id}, timeout=(3, 10))
+        self.assertEqual(response.status_code, 200)
+        filtered = response.json()
+        self.assertEqual([task["task_id"] for task in filtered], [task_id])
+
+        # Let the scrape finish before tearDown deletes the task, so the
+        # background job doesn't write an orphaned output file afterwards
+        self._wait_for_task_completion(task_id, timeout=120)
+    
+    @unittest.skipUnless(E2E_ENABLED, "E2E disabled; set RUN_E2E=1 to scrape real Reddit")
+    def test_delete_task(self):
+        """Test deleting a task"""
+        # Create a task first
+        payload = make_payload(post_limit=2)
+        
+        response = self.http.post(
+            f"{API_BASE_URL}/scrape",
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=(3, 10),
+        )
+        self.assertEqual(response.status_code, 202)
+        
+        data = response.json()
+        task_id = data["task_id"]
+        
+        # Wait for task to complete
+        task_completed = self._wait_for_task_completion(task_id, timeout=60)
+        self.assertTrue(task_completed, "Task did not complete within the timeout period")
+        
+        # Delete the task
+        response = self.http.delete(f"{API_BASE_URL}/tasks/{task_id}", timeout=(3, 10))
+        self.assertEqual(response.status_code, 200)
+        
+        # Try to get the task (should fail)
+        response = self.http.get(f"{API_BASE_URL}/tasks/{task_id}", timeout=(3, 10))
+        self.assertEqual(response.status_code, 404)
+        
+        # No need to add to self.task_ids since we're deleting it manually
+    
+    def test_invalid_task_id(self):
+        """Test accessing a non-existent task"""
+        fake_task_id = "nonexistent-task-id-12345"
+        
+        # Try to get the task
+        response = self.http.get(f"{API_BASE_URL}/tasks/{fake_task_id}", timeout=(3, 10))
+        self.assertEqual(response.status_code, 404)
+        
+        # Try to download the task
+        response = self.http.get(f"{API_BASE_URL}/download/{fake_task_id}", timeout=(3, 10))
+        self.assertEqual(response.status_code, 404)
+        
+        # Try to delete the task
+        response = self.http.delete(f"{API_BASE_URL}/tasks/{fake_task_id}", timeout=(3, 10))
+        self.assertEqual(response.status_code, 404)
+    
+    def test_validation_errors(self):
+        """Test API input validation"""
+        cases = [
+            ("empty subreddit",
+             {"subreddit": "", "post_limit": 5, "output_format": "json"}),
+            ("post limit beyond 100",
+             {"subreddit": "python", "post_limit": 500, "output_format": "json"}),
+            ("invalid output format",
+             {"subreddit": "python", "post_limit": 5, "output_format": "excel"}),
+            ("max delay below min delay",
+             {"subreddit": "python", "post_limit": 5, "output_format": "json",
+              "delay_min": 3.0, "delay_max": 1.0}),
+        ]
+        
+        # Error-only requests with no shared state - fire them in parallel
+        # over the pooled session and assert afterwards
+        def post(case):
+            return self.http.post(f"{API_BASE_URL}/scrape", json=case[1], timeout=(3, 10))
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(cases)) as executor:
+            results = list(executor.map(post, cases))
+        
+        for (description, payload), response in zip(cases, results):
+            with self.subTest(case=description):
+                self.assertEqual(response.status_code, 422)  # Unprocessable Entity
+    
+    def _wait_for_task_completion(self, task_id, timeout=60):
+        """Shared wait helper bound to this class's HTTP client"""
+        return wait_for_task(self.http, task_id, timeout=timeout)
+
+
+class AsyncRedditScraperAPITests(unittest.IsolatedAsyncioTestCase):
+    """Concurrent API tests driven by httpx.AsyncClient"""
+    
+    async def asyncSetUp(self):
+        self.client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            timeout=httpx.Timeout(15.0, connect=3.0),
+        )
+        self.task_ids = []
+    
+    async def asyncTearDown(self):
+        await asyncio.gather(
+            *(self.client.delete(f"/tasks/{task_id}") for task_id in self.task_ids),
+            return_exceptions=True,
+        )
+        await self.client.aclose()
+    
+    async def _run_format(self, fmt):
+        """Submit a scrape in the given format, wait for it and check the output"""
+        payload = make_payload(post_limit=3, output_format=fmt)
+        
+        response = await self.client.post(
+            "/scrape", content=orjson.dumps(payload), headers={"Content-Type": "application/json"}
+        )
+        self.assertEqual(response.status_code, 202)
+        
+        task_id = response.json()["task_id"]
+        self.task_ids.append(task_id)
+        
+        task_completed = await async_wait_for_task(self.client, task_id, timeout=60)
+        self.assertTrue(task_completed, f"Task for {fmt} format did not complete within the timeout period")
+        
+        # HEAD is enough for the non-empty check; no body transfer
+        response = await self.client.head(f"/download/{task_id}")
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(int(response.headers.get("content-length", "0")), 0)
+        
+        # Check file extension
+        response = await self.client.get(f"/tasks/{task_id}")
+        task_data = response.json()
+        self.assertTrue(task_data["output_file"].endswith(f".{fmt}"), 
+                       f"Output file does not have the correct extension: {task_data['output_file']}")
+    
+    @unittest.skipUnless(E2E_ENABLED, "E2E disabled; set RUN_E2E=1 to scrape real Reddit")
+    async def test_all_output_formats(self):
+        """Test all output formats (json, csv, txt) concurrently"""
+        formats = ["json", "csv", "txt"]
+        
+        # The three scrapes run and wait concurrently, so the worst case is
+        # one timeout rather than one per format
+        await asyncio.gather(*(self._run_format(fmt) for fmt in formats))
+
+
+@pytest.mark.xdist_group("mock_api")
+class MockScraperAPITests(unittest.TestCase):
+    """
+    Behavioural tests against an in-process app with canned Reddit pages.
+    
+    The scraper's outbound HTTP is intercepted with `responses`, so routing,
+    output formats, comments and failure handling are covered without any
+    external traffic or a separately running server.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        import re
+        import responses
+        from fastapi.testclient import TestClient
+        
+        # Keep the task database out of the working tree
+        ensure_test_db_path()
+        import main
+        
+        with open(os.path.join(FIXTURES_DIR, "reddit_listing.html"), "rb") as f:
+            listing_page = f.read()
+        with open(os.path.join(FIXTURES_DIR, "reddit_comments.html"), "rb") as f:
+            comments_page = f.read()
+        
+        # One callback instead of several registrations: responses rotates
+        # through stacked matches, which would serve the wrong page to
+        # retried or repeated fetches
+        def reddit_backend(request):
+            if "this_subreddit_does_not_exist" in request.url:
+                return (404, {}, "")
+            if "/comments/" in request.url:
+                return (200, {"Content-Type": "text/html"}, comments_page)
+            return (200, {"Content-Type": "text/html"}, listing_page)
+        
+        cls.reddit_mock = responses.RequestsMock(assert_all_requests_are_fired=False)
+        cls.reddit_mock.add_callback(
+            responses.GET,
+            re.compile(r"https://old\.reddit\.com/.*"),
+            callback=reddit_backend,
+        )
+        cls.reddit_mock.start()
+        
+        cls.client = TestClient(main.app)
+        cls.client.__enter__()
+        # The mock only patches this process, so scrapes must not cross into
+        # the worker processes - swap the pool for in-process threads
+        main.app.state.pool.shutdown(wait=False, cancel_futures=True)
+        main.app.state.pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        
+        # One completed task shared by the read-only tests below; creating
+        # it here once saves a full task lifecycle per test
+        response = cls.client.post(
+            "/scrape", json=make_payload(post_limit=3, delay_min=0.5, delay_max=1.0)
+        )
+        assert response.status_code == 202, response.text
+        cls.shared_task_id = response.json()["task_id"]
+        deadline = time.perf_counter() + 60
+        cls.shared_task = None
+        while time.perf_counter() < deadline:
+            task = cls.client.get(f"/tasks/{cls.shared_task_id}", params={"wait": 10}).json()
+            if task["status"] in ("completed", "failed"):
+                cls.shared_task = task
+                break
+        assert cls.shared_task and cls.shared_task["status"] == "completed", cls.shared_task
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.delete(f"/tasks/{cls.shared_task_id}")
+        cls.client.__exit__(None, None, None)
+        cls.reddit_mock.stop()
+        cls.reddit_mock.reset()
+    
+    def setUp(self):
+        self.task_ids = []
+    
+    def tearDown(self):
+        if not self.task_ids:
+            return
+        def delete(task_id):
+            try:
+                self.client.delete(f"/tasks/{task_id}", timeout=3)
+            except httpx.HTTPError as e:
+                logger.error(f"Error deleting task {task_id}: {str(e)}")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(self.task_ids))) as executor:
+            list(executor.map(delete, self.task_ids))
+    
+    def _submit(self, **overrides):
+        """Submit a scrape task and return its ID"""
+        payload = make_payload(post_limit=3, delay_min=0.5, delay_max=1.0)
+        payload.update(overrides)
+        response = self.client.post("/scrape", json=payload)
+        self.assertEqual(response.status_code, 202)
+        task_id = response.json()["task_id"]
+        self.task_ids.append(task_id)
+        return task_id
+    
+    def _wait(self, task_id, timeout=30):
+        """Long-poll until the task reaches a terminal state"""
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            response = self.client.get(f"/tasks/{task_id}", params={"wait": 10})
+            if response.status_code == 200:
+                data = response.json()
+                if data["status"] in ("completed", "failed"):
+                    return data
+        self.fail(f"Task {task_id} did not finish within {timeout} seconds")
+    
+    def test_basic_scrape(self):
+        """The shared scrape against the canned listing completed with its posts"""
+        self.assertEqual(self.shared_task["status"], "completed")
+        self.assertEqual(self.shared_task["post_count"], 2)
+        
+        response = self.client.get(f"/download/{self.shared_task_id}")
+        self.assertEqual(response.status_code, 200)
+        posts = response.json()
+        self.assertEqual(len(posts), 2)
+        self.assertEqual(posts[0]["author"], "alice")
+        # The listing ends with a self post carrying expando text; its body
+        # must come through and must not break the next-page byte scan
+        self.assertTrue(posts[1]["is_self_post"])
+        self.assertEqual(posts[1]["content"], "Happy to answer questions all day.")
+    
+    def test_task_analytics(self):
+        """The shared task exposes analytics on request"""
+        response = self.client.get(
+            f"/tasks/{self.shared_task_id}", params={"include_analytics": "true"}
+        )
+        self.assertEqual(response.status_code, 200)
+        task = response.json()
+        self.assertIn("analytics", task)
+        self.assertEqual(task["analytics"]["total_posts"], 2)
+        # Server-side bookkeeping such as the filesystem path stays private
+        self.assertNotIn("output_path", task)
+    
+    def test_completion_push(self):
+        """/tasks/ws pushes one terminal notification per requested task"""
+        task_id = self._submit()
+        with self.client.websocket_connect("/tasks/ws") as ws:
+            ws.send_json({"ids": [task_id, "no-such-task"]})
+            messages = {}
+            for _ in range(2):
+                message = ws.receive_json()
+                messages[message["task_id"]] = message["status"]
+        self.assertEqual(messages[task_id], "completed")
+        self.assertEqual(messages["no-such-task"], "unknown")
+
+    def test_get_all_tasks(self):
+        """The shared task shows up in the task list"""
+        response = self.client.get("/tasks")
+        self.assertEqual(response.status_code, 200)
+        tasks = response.json()
+        self.assertIsInstance(tasks, list)
+        self.assertIn(self.shared_task_id, {task["task_id"] for task in tasks})
+
+        response = self.client.get("/tasks", params={"ids": self.shared_task_id})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([task["task_id"] for task in response.json()], [self.shared_task_id])
+    
+    def test_delete_task(self):
+        """Deleting a task removes it; uses its own task, not the shared one"""
+        task_id = self._submit()
+        task = self._wait(task_id)
+        self.assertEqual(task["status"], "completed")
+        
+        response = self.client.delete(f"/tasks/{task_id}")
+        self.assertEqual(response.status_code, 200)
+        self.task_ids.remove(task_id)
+        
+        response = self.client.get(f"/tasks/{task_id}")
+        self.assertEqual(response.status_code, 404)
+    
+    def test_include_comments(self):
+        """Comments from the canned comment page are attached to posts"""
+        task_id = self._submit(include_comments=True)
+        task = self._wait(task_id)
+        self.assertEqual(task["status"], "completed")
+        
+        posts = self.client.get(f"/download/{task_id}").json()
+        self.assertIn("comments", posts[0], "Comments were not included in the response")
+        self.assertEqual(posts[0]["comments"][0]["author"], "carol")
+    
+    def test_all_output_formats(self):
+        """Every output format produces a downloadable file"""
+        for fmt in ("json", "csv", "txt", "jsonl"):
+            with self.subTest(fmt=fmt):
+                task_id = self._submit(output_format=fmt)
+                task = self._wait(task_id)
+                self.assertEqual(task["status"], "completed")
+                self.assertTrue(task["output_file"].endswith(f".{fmt}"),
+                               f"Output file does not have the correct extension: {task['output_file']}")
+                
+                response = self.client.head(f"/download/{task_id}")
+                self.assertEqual(response.status_code, 200)
+                self.assertGreater(int(response.headers.get("content-length", "0")), 0)
+    
+    def test_invalid_subreddit(self):
+        """A subreddit that 404s either fails or completes empty"""
+        task_id = self._submit(subreddit="this_subreddit_does_not_exist_12345")
+        task = self._wait(task_id, timeout=60)
+        if task["status"] == "failed":
+            self.assertIn("error", task)
+        else:
+            self.assertEqual(task.get("post_count", 0), 0)
+
+
+
+@pytest.mark.load
+class LoadTest(unittest.IsolatedAsyncioTestCase):
+    """Basic load testing for the Reddit Scraper API"""
+    
+    async def asyncSetUp(self):
+        """Set up test case"""
+        self.client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            timeout=httpx.Timeout(15.0, connect=3.0),
+        )
+        self.task_ids = []  # Store task IDs for cleanup
+    
+    async def asyncTearDown(self):
+        """Clean up after test case"""
+        await asyncio.gather(
+            *(self.client.delete(f"/tasks/{task_id}") for task_id in self.task_ids),
+            return_exceptions=True,
+        )
+        await self.client.aclose()
+
+    async def _await_all(self, task_ids, timeout=120):
+        """
+        Wait for every task via the /tasks/ws push endpoint.
+
+        Returns {task_id: final_status}. Falls back to long-polling each
+        task if the server predates the endpoint or the handshake fails.
+        """
+        ws_url = API_BASE_URL.replace("http", "ws", 1) + "/tasks/ws"
+        try:
+            import websockets
+
+            async def collect():
+                statuses = {}
+                async with websockets.connect(ws_url) as ws:
+                    await ws.send(json.dumps({"ids": task_ids}))
+                    remaining = set(task_ids)
+                    while remaining:
+                        msg = json.loads(await ws.recv())
+                        statuses[msg["task_id"]] = msg["status"]
+                        remaining.discard(msg["task_id"])
+                return statuses
+
+            # wait_for rather than asyncio.timeout: the suite still runs
+            # on Python 3.10
+            return await asyncio.wait_for(collect(), timeout)
+        except Exception as e:  # 404 handshake, missing websockets, timeout, ...
+            logger.warning(f"Push notifications unavailable ({e}); falling back to polling")
+            outcomes = await asyncio.gather(
+                *(async_wait_for_task(self.client, task_id, timeout=timeout) for task_id in task_ids)
+            )
+            return {
+                task_id: ("completed" if ok else "failed")
+                for task_id, ok in zip(task_ids, outcomes)
+            }
+
+    @unittest.skipUnless(E2E_ENABLED, "E2E disabled; set RUN_E2E=1 to scrape real Reddit")
+    async def test_concurrent_requests(self):
+        """Test submitting multiple requests concurrently"""
+        # List of subreddits to scrape
+        subreddits = ["python", "programming", "webdev", "datascience", "machinelearning"]
+        
+        
+        # Coroutine to submit a task
+        async def submit_task(subreddit):
+            try:
+                response = await self.client.post(
+                    "/scrape",
+                    content=orjson.dumps(make_payload(subreddit=subreddit)),
+                    headers={"Content-Type": "application/json"},
+                )
+                if response.status_code == 202:
+                    data = response.json()
+                    logger.info(f"Successfully submitted task for {subreddit}: {data['task_id']}")
+                    return data["task_id"]
+                else:
+                    logger.error(f"Failed to submit task for {subreddit}: {response.status_code}")
+                    return None
+            except Exception as e:
+                logger.error(f"Error submitting task for {subreddit}: {str(e)}")
+                return None
+        
+        # Submit tasks concurrently
+        results = await asyncio.gather(*(submit_task(subreddit) for subreddit in subreddits))
+        self.task_ids = [task_id for task_id in results if task_id]
+        
+        # Check if all tasks were submitted
+        self.assertEqual(len(self.task_ids), len(subreddits), 
+                         "Not all tasks were submitted successfully")
+        
+        # Wait for all tasks via the push endpoint; total time is the
+        # slowest task, not a sum of polling loops
+        statuses = await self._await_all(self.task_ids, timeout=120)
+        completed_tasks = sum(1 for status in statuses.values() if status == "completed")
+        
+        logger.info(f"{completed_tasks} out of {len(self.task_ids)} tasks completed successfully")
+        
+        # Check if at least some tasks completed successfully
+        self.assertGreater(completed_tasks, 0, "No tasks completed successfully")
+
+
+if __name__ == "__main__":
+    # Direct invocation shortcut; CI runs `pytest -n auto --dist=loadgroup`
+    # so independent tests overlap while grouped classes share one worker
+    pytest_args = ["-v", __file__]
+    if len(sys.argv) > 1 and sys.argv[1] == "--load-test":
+        pytest_args += ["-m", "load or not load"]
+    sys.exit(pytest.main(pytest_args))
\ No newline at end of file